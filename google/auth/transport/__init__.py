@@ -42,6 +42,9 @@ DEFAULT_MAX_REFRESH_ATTEMPTS = 2
 class Response(object):
     """HTTP Response data."""
 
+    # No instance attributes, so that adapters can declare __slots__.
+    __slots__ = ()
+
     @abc.abstractproperty
     def status(self):
         """int: The HTTP status code."""
@@ -68,6 +71,9 @@ class Request(object):
     .. automethod:: __call__
     """
 
+    # No instance attributes, so that adapters can declare __slots__.
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(
         self, url, method="GET", body=None, headers=None, timeout=None, **kwargs
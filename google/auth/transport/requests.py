@@ -19,6 +19,8 @@ from __future__ import absolute_import
 import functools
 import logging
 import numbers
+import os
+import threading
 import time
 
 try:
@@ -39,6 +41,7 @@ from requests.packages.urllib3.util.ssl_ import (
     create_urllib3_context,
 )  # pylint: disable=ungrouped-imports
 import six  # pylint: disable=ungrouped-imports
+from six.moves import http_cookiejar  # pylint: disable=ungrouped-imports
 
 from google.auth import exceptions
 from google.auth import transport
@@ -48,6 +51,17 @@ _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_TIMEOUT = 120  # in seconds
 
+# The number of connections per host kept alive by the default session.
+_DEFAULT_POOL_MAXSIZE = 32
+
+# The session shared by all Request instances constructed without an explicit
+# session, and the id of the process that created it. Created lazily by
+# _get_default_session, and created again in a forked child so that the child
+# never reuses the parent's pooled connections.
+_DEFAULT_SESSION = None
+_DEFAULT_SESSION_PID = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
 
 class _Response(transport.Response):
     """Requests transport response adapter.
@@ -56,6 +70,8 @@ class _Response(transport.Response):
         response (requests.Response): The raw Requests response.
     """
 
+    __slots__ = ("_response",)
+
     def __init__(self, response):
         self._response = response
 
@@ -92,7 +108,8 @@ class TimeoutGuard(object):
         self._timeout_error_type = timeout_error_type
 
     def __enter__(self):
-        self._start = time.time()
+        if self._timeout is not None:
+            self._start = time.time()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -116,6 +133,54 @@ class TimeoutGuard(object):
             raise self._timeout_error_type()
 
 
+def _make_default_session():
+    """Creates the session shared by default :class:`Request` instances.
+
+    Returns:
+        requests.Session: A session with pooled, non-retrying adapters that
+            does not store cookies.
+    """
+    session = requests.Session()
+
+    # As the session is shared by every default Request in the process, keep
+    # more connections per host alive than requests' default of 10, so that
+    # concurrent requests do not discard pooled connections. Unlike the
+    # AuthorizedSession refresh session, these adapters do not retry.
+    for prefix in ("https://", "http://"):
+        session.mount(
+            prefix, requests.adapters.HTTPAdapter(pool_maxsize=_DEFAULT_POOL_MAXSIZE)
+        )
+
+    # The session outlives any one set of credentials, so never store cookies
+    # that a token, metadata or certificate endpoint sets: they would be
+    # replayed on later requests made for unrelated principals.
+    session.cookies.set_policy(http_cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def _get_default_session():
+    """Returns the module-level session shared by default Request instances.
+
+    Sharing one session lets repeated credential refreshes reuse pooled
+    keep-alive connections instead of paying for a new TCP and TLS handshake
+    on every fresh :class:`Request`. The session is per process: after a fork
+    the child gets a new session rather than the parent's sockets.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _DEFAULT_SESSION, _DEFAULT_SESSION_PID
+    pid = os.getpid()
+    if _DEFAULT_SESSION_PID != pid:
+        with _DEFAULT_SESSION_LOCK:
+            if _DEFAULT_SESSION_PID != pid:
+                # The parent's session, if any, is dropped rather than closed,
+                # as closing it would shut down sockets the parent still uses.
+                _DEFAULT_SESSION = _make_default_session()
+                _DEFAULT_SESSION_PID = pid
+    return _DEFAULT_SESSION
+
+
 class Request(transport.Request):
     """Requests request adapter.
 
@@ -135,14 +200,22 @@ class Request(transport.Request):
 
     Args:
         session (requests.Session): An instance :class:`requests.Session` used
-            to make HTTP requests. If not specified, a session will be created.
+            to make HTTP requests. If not specified, a session shared by all
+            such :class:`Request` instances in the current process is used.
+            That session does not store cookies. It must not be mounted on,
+            reconfigured or closed, as the change would affect every other
+            default :class:`Request`.
+            Applications that need to control the session's lifetime or
+            configuration should pass their own session.
 
     .. automethod:: __call__
     """
 
+    __slots__ = ("session",)
+
     def __init__(self, session=None):
         if not session:
-            session = requests.Session()
+            session = _get_default_session()
 
         self.session = session
 
@@ -176,7 +249,8 @@ class Request(transport.Request):
             google.auth.exceptions.TransportError: If any exception occurred.
         """
         try:
-            _LOGGER.debug("Making request: %s %s", method, url)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Making request: %s %s", method, url)
             response = self.session.request(
                 method, url, data=body, headers=headers, timeout=timeout, **kwargs
             )
@@ -305,7 +379,8 @@ class AuthorizedSession(requests.Session):
             :class:`~google.auth.transport.requests.Request` used when
             refreshing credentials. If not passed,
             an instance of :class:`~google.auth.transport.requests.Request`
-            is created.
+            is created, backed by a session of its own that retries failed
+            connections.
     """
 
     def __init__(
@@ -318,23 +393,35 @@ class AuthorizedSession(requests.Session):
     ):
         super(AuthorizedSession, self).__init__()
         self.credentials = credentials
-        self._refresh_status_codes = refresh_status_codes
+        # Stored as a frozenset, as it is checked against every response.
+        self._refresh_status_codes = frozenset(refresh_status_codes)
         self._max_refresh_attempts = max_refresh_attempts
         self._refresh_timeout = refresh_timeout
         self._is_mtls = False
+        # Serializes credential refreshes across threads sharing this session.
+        # The generation is bumped on every refresh, so that a request which
+        # raced with it can tell that the credentials have already been
+        # refreshed since it was sent.
+        self._refresh_lock = threading.Lock()
+        self._refresh_generation = 0
+
+        # The session this instance created for auth_request, if any. Only
+        # that session is closed by close(); a caller-provided auth_request
+        # is left for the caller to clean up.
+        self._auth_request_session = None
 
         if auth_request is None:
-            auth_request_session = requests.Session()
+            self._auth_request_session = requests.Session()
 
             # Using an adapter to make HTTP requests robust to network errors.
             # This adapter retrys HTTP requests when network errors occur
             # and the requests seems safely retryable.
             retry_adapter = requests.adapters.HTTPAdapter(max_retries=3)
-            auth_request_session.mount("https://", retry_adapter)
+            self._auth_request_session.mount("https://", retry_adapter)
 
             # Do not pass `self` as the session here, as it can lead to
             # infinite recursion.
-            auth_request = Request(auth_request_session)
+            auth_request = Request(self._auth_request_session)
 
         # Request instance used by internal methods (for example,
         # credentials.refresh).
@@ -418,82 +505,96 @@ class AuthorizedSession(requests.Session):
         # (method, url) are required. We pass through all of the other
         # arguments to super, so no need to exhaustively list them here.
 
-        # Use a kwarg for this instead of an attribute to maintain
-        # thread-safety.
-        _credential_refresh_attempt = kwargs.pop("_credential_refresh_attempt", 0)
-
         # Make a copy of the headers. They will be modified by the credentials
-        # and we want to pass the original headers if we recurse.
+        # and we do not want to modify the caller's headers. The copy is reused
+        # across refresh attempts, as the credentials only ever overwrite the
+        # same keys again.
         request_headers = headers.copy() if headers is not None else {}
 
         # Do not apply the timeout unconditionally in order to not override the
-        # _auth_request's default timeout.
+        # _auth_request's default timeout. The same callable is used for both
+        # before_request and refresh below.
         auth_request = (
             self._auth_request
             if timeout is None
             else functools.partial(self._auth_request, timeout=timeout)
         )
 
+        # Bind the attributes used on every attempt to locals. The refresh
+        # generation is deliberately left out, as other threads update it.
+        credentials = self.credentials
+        refresh_status_codes = self._refresh_status_codes
+        max_refresh_attempts = self._max_refresh_attempts
+        refresh_lock = self._refresh_lock
+        send_request = super(AuthorizedSession, self).request
+
         remaining_time = max_allowed_time
 
-        with TimeoutGuard(remaining_time) as guard:
-            self.credentials.before_request(auth_request, method, url, request_headers)
-        remaining_time = guard.remaining_timeout
-
-        with TimeoutGuard(remaining_time) as guard:
-            response = super(AuthorizedSession, self).request(
-                method,
-                url,
-                data=data,
-                headers=request_headers,
-                timeout=timeout,
-                **kwargs
-            )
-        remaining_time = guard.remaining_timeout
-
-        # If the response indicated that the credentials needed to be
-        # refreshed, then refresh the credentials and re-attempt the
-        # request.
-        # A stored token may expire between the time it is retrieved and
-        # the time the request is made, so we may need to try twice.
-        if (
-            response.status_code in self._refresh_status_codes
-            and _credential_refresh_attempt < self._max_refresh_attempts
-        ):
-
-            _LOGGER.info(
-                "Refreshing credentials due to a %s response. Attempt %s/%s.",
-                response.status_code,
-                _credential_refresh_attempt + 1,
-                self._max_refresh_attempts,
-            )
+        # Use a local for this instead of an attribute to maintain
+        # thread-safety.
+        credential_refresh_attempt = 0
 
-            # Do not apply the timeout unconditionally in order to not override the
-            # _auth_request's default timeout.
-            auth_request = (
-                self._auth_request
-                if timeout is None
-                else functools.partial(self._auth_request, timeout=timeout)
-            )
+        while True:
+            refresh_generation = self._refresh_generation
 
             with TimeoutGuard(remaining_time) as guard:
-                self.credentials.refresh(auth_request)
+                credentials.before_request(auth_request, method, url, request_headers)
             remaining_time = guard.remaining_timeout
 
-            # Recurse. Pass in the original headers, not our modified set, but
-            # do pass the adjusted max allowed time (i.e. the remaining total time).
-            return self.request(
-                method,
-                url,
-                data=data,
-                headers=headers,
-                max_allowed_time=remaining_time,
-                timeout=timeout,
-                _credential_refresh_attempt=_credential_refresh_attempt + 1,
-                **kwargs
-            )
+            with TimeoutGuard(remaining_time) as guard:
+                response = send_request(
+                    method,
+                    url,
+                    data=data,
+                    headers=request_headers,
+                    timeout=timeout,
+                    **kwargs
+                )
+            remaining_time = guard.remaining_timeout
 
-        return response
+            # If the response indicated that the credentials needed to be
+            # refreshed, then refresh the credentials and re-attempt the
+            # request.
+            # A stored token may expire between the time it is retrieved and
+            # the time the request is made, so we may need to try twice.
+            if (
+                response.status_code not in refresh_status_codes
+                or credential_refresh_attempt >= max_refresh_attempts
+            ):
+                return response
+
+            # If another thread refreshed the credentials while this request
+            # was in flight, retry with them instead of refreshing again. The
+            # generation is checked before taking the lock, so that requests
+            # failing after a refresh has completed do not wait on the lock,
+            # and again once the lock is held, so that requests which waited
+            # on an in-progress refresh do not repeat it.
+            if self._refresh_generation == refresh_generation:
+                with TimeoutGuard(remaining_time) as guard:
+                    with refresh_lock:
+                        if self._refresh_generation == refresh_generation:
+                            _LOGGER.info(
+                                "Refreshing credentials due to a %s response. "
+                                "Attempt %s/%s.",
+                                response.status_code,
+                                credential_refresh_attempt + 1,
+                                max_refresh_attempts,
+                            )
+                            credentials.refresh(auth_request)
+                            self._refresh_generation += 1
+                remaining_time = guard.remaining_timeout
+
+            credential_refresh_attempt += 1
+
+    def close(self):
+        """Closes the session and the session it created for refreshes.
+
+        The session backing an ``auth_request`` passed to the constructor is
+        not closed.
+        """
+        if self._auth_request_session is not None:
+            self._auth_request_session.close()
+        super(AuthorizedSession, self).close()
 
     @property
     def is_mtls(self):
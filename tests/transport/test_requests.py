@@ -15,6 +15,8 @@
 import datetime
 import functools
 import sys
+import threading
+import time
 
 import freezegun
 import mock
@@ -22,6 +24,7 @@ import OpenSSL
 import pytest
 import requests
 import requests.adapters
+import responses
 from six.moves import http_client
 
 from google.auth import exceptions
@@ -37,6 +40,12 @@ def frozen_time():
         yield frozen
 
 
+@pytest.fixture
+def reset_default_session(monkeypatch):
+    monkeypatch.setattr(google.auth.transport.requests, "_DEFAULT_SESSION", None)
+    monkeypatch.setattr(google.auth.transport.requests, "_DEFAULT_SESSION_PID", None)
+
+
 class TestRequestResponse(compliance.RequestResponseTests):
     def make_request(self):
         return google.auth.transport.requests.Request()
@@ -48,6 +57,103 @@ class TestRequestResponse(compliance.RequestResponseTests):
 
         assert http.request.call_args[1]["timeout"] == 5
 
+    def test_debug_logging(self):
+        http = mock.create_autospec(requests.Session, instance=True)
+        request = google.auth.transport.requests.Request(http)
+        logger = google.auth.transport.requests._LOGGER
+
+        with mock.patch.object(logger, "debug") as debug:
+            with mock.patch.object(logger, "isEnabledFor", return_value=False):
+                request(url="http://example.com", method="GET")
+            assert not debug.called
+
+            with mock.patch.object(logger, "isEnabledFor", return_value=True):
+                request(url="http://example.com", method="GET")
+            debug.assert_called_once_with(
+                "Making request: %s %s", "GET", "http://example.com"
+            )
+
+    def test_no_instance_dict(self):
+        request = google.auth.transport.requests.Request()
+        response = google.auth.transport.requests._Response(make_response())
+
+        assert not hasattr(request, "__dict__")
+        assert not hasattr(response, "__dict__")
+
+    def test_default_session_is_shared(self):
+        first = google.auth.transport.requests.Request()
+        second = google.auth.transport.requests.Request()
+
+        assert isinstance(first.session, requests.Session)
+        assert first.session is second.session
+
+    def test_default_session_recreated_after_fork(self, reset_default_session):
+        parent_session = google.auth.transport.requests.Request().session
+
+        with mock.patch("os.getpid", return_value=-1):
+            child_session = google.auth.transport.requests.Request().session
+            assert google.auth.transport.requests.Request().session is child_session
+
+        assert child_session is not parent_session
+
+    def test_default_session_created_once_under_contention(self, reset_default_session):
+        def make_session():
+            # Widen the window in which racing threads could each build one.
+            time.sleep(0.01)
+            return object()
+
+        patcher = mock.patch(
+            "google.auth.transport.requests._make_default_session",
+            side_effect=make_session,
+        )
+        sessions = []
+
+        def make_request():
+            sessions.append(google.auth.transport.requests.Request().session)
+
+        with patcher as make_default_session:
+            threads = [threading.Thread(target=make_request) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert make_default_session.call_count == 1
+        assert len(sessions) == 8
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_default_session_pooled_without_retries(self, reset_default_session):
+        session = google.auth.transport.requests.Request().session
+
+        for url in ("https://example.com", "http://example.com"):
+            adapter = session.get_adapter(url)
+            assert adapter.max_retries.total == 0
+            assert (
+                adapter._pool_maxsize
+                == google.auth.transport.requests._DEFAULT_POOL_MAXSIZE
+            )
+
+    @responses.activate
+    def test_default_session_does_not_store_cookies(self, reset_default_session):
+        responses.add(
+            responses.GET,
+            "https://example.com/token",
+            headers={"Set-Cookie": "sid=secret; Path=/"},
+        )
+        request = google.auth.transport.requests.Request()
+
+        request(url="https://example.com/token", method="GET")
+        request(url="https://example.com/token", method="GET")
+
+        assert len(request.session.cookies) == 0
+        assert "Cookie" not in responses.calls[1].request.headers
+
+    def test_explicit_session(self):
+        http = mock.create_autospec(requests.Session, instance=True)
+        request = google.auth.transport.requests.Request(http)
+
+        assert request.session is http
+
 
 class TestTimeoutGuard(object):
     def make_guard(self, *args, **kwargs):
@@ -69,6 +175,14 @@ class TestTimeoutGuard(object):
         # NOTE: no timeout error raised, despite years have passed
         assert guard.remaining_timeout is None
 
+    def test_no_clock_reads_if_no_timeout(self):
+        with mock.patch("time.time") as time_mock:
+            with self.make_guard(timeout=None) as guard:
+                pass
+
+        assert not time_mock.called
+        assert guard.remaining_timeout is None
+
     def test_timeout_error_w_numeric_timeout(self, frozen_time):
         with pytest.raises(requests.exceptions.Timeout):
             with self.make_guard(timeout=10) as guard:
@@ -198,6 +312,53 @@ class TestAuthorizedSession(object):
         )
 
         assert authed_session.credentials == mock.sentinel.credentials
+        assert authed_session._refresh_status_codes == frozenset(
+            google.auth.transport.DEFAULT_REFRESH_STATUS_CODES
+        )
+
+    def test_constructor_creates_auth_session(self, reset_default_session):
+        authed_session = google.auth.transport.requests.AuthorizedSession(
+            mock.sentinel.credentials
+        )
+
+        auth_session = authed_session._auth_request.session
+        assert auth_session is not authed_session
+        assert auth_session is not google.auth.transport.requests.Request().session
+        assert auth_session.get_adapter("https://").max_retries.total == 3
+
+    def test_close_closes_auth_session(self):
+        authed_session = google.auth.transport.requests.AuthorizedSession(
+            mock.sentinel.credentials
+        )
+        auth_session = authed_session._auth_request.session
+
+        with mock.patch.object(auth_session, "close") as close:
+            authed_session.close()
+
+        close.assert_called_once_with()
+
+    def test_context_manager_closes_auth_session(self):
+        authed_session = google.auth.transport.requests.AuthorizedSession(
+            mock.sentinel.credentials
+        )
+        auth_session = authed_session._auth_request.session
+
+        with mock.patch.object(auth_session, "close") as close:
+            with authed_session:
+                pass
+
+        close.assert_called_once_with()
+
+    def test_close_keeps_provided_auth_request_session(self):
+        http = mock.create_autospec(requests.Session, instance=True)
+        auth_request = google.auth.transport.requests.Request(http)
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(
+            mock.sentinel.credentials, auth_request=auth_request
+        )
+        authed_session.close()
+
+        assert not http.close.called
 
     def test_constructor_with_auth_request(self):
         http = mock.create_autospec(requests.Session)
@@ -259,6 +420,7 @@ class TestAuthorizedSession(object):
         assert result == final_response
         assert credentials.before_request.call_count == 2
         assert credentials.refresh.called
+        assert authed_session._refresh_generation == 1
         assert len(adapter.requests) == 2
 
         assert adapter.requests[0].url == self.TEST_URL
@@ -267,6 +429,175 @@ class TestAuthorizedSession(object):
         assert adapter.requests[1].url == self.TEST_URL
         assert adapter.requests[1].headers["authorization"] == "token1"
 
+    def test_request_refresh_skipped_if_refreshed_concurrently(self):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        final_response = make_response(status=http_client.OK)
+        adapter = AdapterStub(
+            [make_response(status=http_client.UNAUTHORIZED), final_response]
+        )
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(credentials)
+        authed_session.mount(self.TEST_URL, adapter)
+
+        def send_while_refreshed(request, **kwargs):
+            # Simulate another thread refreshing the credentials while the
+            # first request is in flight.
+            authed_session._refresh_generation += 1
+            return AdapterStub.send(adapter, request, **kwargs)
+
+        adapter.send = send_while_refreshed
+
+        with mock.patch.object(authed_session, "_refresh_lock") as refresh_lock:
+            result = authed_session.request("GET", self.TEST_URL)
+
+        assert result == final_response
+        assert not credentials.refresh.called
+        assert not refresh_lock.__enter__.called
+        assert len(adapter.requests) == 2
+
+    def test_request_refresh_skipped_if_refreshed_while_waiting(self):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        final_response = make_response(status=http_client.OK)
+        adapter = AdapterStub(
+            [make_response(status=http_client.UNAUTHORIZED), final_response]
+        )
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(credentials)
+        authed_session.mount(self.TEST_URL, adapter)
+
+        def acquire_after_refresh():
+            # Simulate another thread refreshing the credentials while this
+            # one waits for the lock.
+            authed_session._refresh_generation += 1
+
+        with mock.patch.object(authed_session, "_refresh_lock") as refresh_lock:
+            refresh_lock.__enter__.side_effect = acquire_after_refresh
+            result = authed_session.request("GET", self.TEST_URL)
+
+        assert result == final_response
+        assert refresh_lock.__enter__.called
+        assert not credentials.refresh.called
+        assert len(adapter.requests) == 2
+
+    def test_request_waits_for_in_progress_refresh(self):
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+
+        class BlockingCredentialsStub(CredentialsStub):
+            def refresh(self, request):
+                refresh_started.set()
+                release_refresh.wait(5)
+                super(BlockingCredentialsStub, self).refresh(request)
+
+        class TokenCheckingAdapterStub(AdapterStub):
+            def send(self, request, **kwargs):
+                self.requests.append(request)
+                if request.headers["authorization"] == "token":
+                    return make_response(status=http_client.UNAUTHORIZED)
+                return make_response(status=http_client.OK)
+
+        class ContendedLock(object):
+            def __init__(self):
+                self._lock = threading.Lock()
+                self.acquire_attempts = 0
+
+            def __enter__(self):
+                self.acquire_attempts += 1
+                self._lock.acquire()
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                self._lock.release()
+
+        credentials = mock.Mock(wraps=BlockingCredentialsStub())
+        adapter = TokenCheckingAdapterStub([])
+        refresh_lock = ContendedLock()
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(credentials)
+        authed_session.mount(self.TEST_URL, adapter)
+        authed_session._refresh_lock = refresh_lock
+
+        results = []
+
+        def make_request():
+            results.append(authed_session.request("GET", self.TEST_URL))
+
+        first = threading.Thread(target=make_request)
+        first.start()
+        assert refresh_started.wait(5)
+
+        # The second request gets its 401 while the first thread is still
+        # refreshing, so it has to wait on the lock rather than skip it.
+        second = threading.Thread(target=make_request)
+        second.start()
+        deadline = time.time() + 5
+        while refresh_lock.acquire_attempts < 2 and time.time() < deadline:
+            time.sleep(0.001)
+        assert refresh_lock.acquire_attempts == 2
+
+        release_refresh.set()
+        first.join(5)
+        second.join(5)
+
+        assert credentials.refresh.call_count == 1
+        assert [result.status_code for result in results] == [200, 200]
+        assert len(adapter.requests) == 4
+        assert adapter.requests[-1].headers["authorization"] == "token1"
+
+    def test_request_max_refresh_attempts(self):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        final_response = make_response(status=http_client.UNAUTHORIZED)
+        adapter = AdapterStub(
+            [
+                make_response(status=http_client.UNAUTHORIZED),
+                make_response(status=http_client.UNAUTHORIZED),
+                final_response,
+            ]
+        )
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(
+            credentials, max_refresh_attempts=2
+        )
+        authed_session.mount(self.TEST_URL, adapter)
+
+        result = authed_session.request("GET", self.TEST_URL)
+
+        assert result == final_response
+        assert credentials.refresh.call_count == 2
+        assert len(adapter.requests) == 3
+        assert adapter.requests[2].headers["authorization"] == "token11"
+
+    def test_request_refresh_does_not_modify_headers(self):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        adapter = AdapterStub(
+            [make_response(status=http_client.UNAUTHORIZED), make_response()]
+        )
+        headers = {"x-test": "value"}
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(credentials)
+        authed_session.mount(self.TEST_URL, adapter)
+
+        authed_session.request("GET", self.TEST_URL, headers=headers)
+
+        assert headers == {"x-test": "value"}
+        assert adapter.requests[1].headers["x-test"] == "value"
+        assert adapter.requests[1].headers["authorization"] == "token1"
+
+    def test_request_refresh_reuses_auth_request(self):
+        credentials = mock.Mock(wraps=CredentialsStub())
+        adapter = AdapterStub(
+            [make_response(status=http_client.UNAUTHORIZED), make_response()]
+        )
+
+        authed_session = google.auth.transport.requests.AuthorizedSession(credentials)
+        authed_session.mount(self.TEST_URL, adapter)
+
+        authed_session.request("GET", self.TEST_URL, timeout=5)
+
+        first_auth_request = credentials.before_request.call_args_list[0][0][0]
+        refresh_auth_request = credentials.refresh.call_args[0][0]
+        assert refresh_auth_request is first_auth_request
+        assert refresh_auth_request.keywords == {"timeout": 5}
+
     def test_request_max_allowed_time_timeout_error(self, frozen_time):
         tick_one_second = functools.partial(
             frozen_time.tick, delta=datetime.timedelta(seconds=1.0)